@@ -1,13 +1,31 @@
-from datetime import datetime
+from concurrent.futures import ThreadPoolExecutor, as_completed, wait
+import argparse
+from datetime import date, datetime
+from pathlib import Path
+import functools
+import json
 import pandas as pd
 import numpy as np
 import yfinance as yf
+from yfinance.exceptions import YFException
+from numba import njit
 from bokeh.io import show
-from bokeh.models import DatetimeTickFormatter, Div, LinearColorMapper, ColorBar
+from bokeh.models import (BooleanFilter, CDSView, ColumnDataSource, CustomJSTickFormatter, DatetimeTickFormatter, Div,
+                          FixedTicker, LinearColorMapper, ColorBar, Range1d)
 from bokeh.plotting import figure
 from bokeh.layouts import column, row
 from bokeh.models.formatters import NumeralTickFormatter
 
+CACHE_DIR = Path('.cache')
+MAX_POINTS = 2000
+NAME_TIMEOUT = 5 # seconds to wait for a company name once the history has arrived
+_MONTH_FMT = DatetimeTickFormatter(months='%b %Y')
+_VOL_FMT = NumeralTickFormatter(format='0.00a')
+WEEKDAYS = ['Monday', 'Tuesday', 'Wednesday', 'Thursday', 'Friday']
+GL_STYLE = {True: ('Gain', 'green'), False: ('Loss', 'red')}
+PURCHASE_DETAILS_TEMPLATE = ("Total Cost: ${tc:,.2f}<br>Total Shares: {ts:,.2f}<br>Current Value: ${cv:,.2f}<br>"
+                             "Average Cost Basis: ${ab:,.2f}<br>{label} between {pd} and {ed}: ${gl:,.0f}")
+
 def user_input():
     """
     Prompts the user for input and returns a tuple of the ticker symbol choice, 
@@ -38,115 +56,294 @@ def get_purchase_info():
         
     return purchase_info
 
-def ticker(choice, start_date, end_date):
+def read_purchase_info(path):
+    """
+    Function input: path to a CSV file with a header row, purchase dates (YYYY-MM-DD) in the first column
+    and the number of shares in the second column.
+    Returns the same dictionary as get_purchase_info without prompting the user.
+    """
+    return dict(pd.read_csv(path, usecols=[0, 1]).values.tolist())
+
+def _cache_path(choice, start_date, end_date):
+    """
+    Function inputs: ticker choice, start and end dates of stock history.
+    Returns the on-disk cache file for the ticker and period.
+    """
+    return CACHE_DIR / f'{choice}_{start_date}_{end_date}.parquet'
+
+def _write_cache(choice, start_date, end_date, stock_data, company_name):
+    """
+    Function inputs: ticker choice, start and end dates of stock history, stock data and company name.
+    Saves the stock data as Parquet and the company name as a sibling JSON file if the period has already ended.
+    Empty stock data (yfinance's result for a failed or unknown ticker) is not cached, so the next run retries.
+    """
+    # the end date is exclusive, but yfinance reads it in the exchange's timezone, which can be a day behind
+    # the local date, so only periods ending before today are certain to contain no unfinished trading day
+    if not stock_data.empty and datetime.strptime(end_date, '%Y-%m-%d').date() < date.today():
+        CACHE_DIR.mkdir(exist_ok=True)
+        cache_path = _cache_path(choice, start_date, end_date)
+        # the Parquet file marks a cache hit, so write it last
+        cache_path.with_suffix('.json').write_text(json.dumps({'company_name': company_name}))
+        stock_data.to_parquet(cache_path, compression='zstd')
+
+def _company_name(choice):
+    """
+    Function input: ticker choice.
+    Returns the company name of the ticker, or None if the lookup fails or Yahoo does not provide one.
+    """
+    # network errors from both requests and curl_cffi (used by newer yfinance) are OSError subclasses,
+    # rate limiting raises YFRateLimitError and a malformed response raises a ValueError
+    try:
+        return yf.Ticker(choice).get_info()['longName']
+    except (KeyError, ValueError, OSError, YFException):
+        return None
+
+@functools.lru_cache(maxsize=128)
+def _fetch(choice, start_date, end_date):
     """
     Function inputs: ticker choice, start and end dates of stock history.
-    Prints the user selected ticker symbol and company name. 
-    Returns the stock data from the user inputted choice.
+    Returns the stock data and company name, loading them from the on-disk cache when available.
+    Otherwise the history and company name requests are sent in parallel, and the results are only cached
+    if the company name lookup succeeded in time; the ticker symbol stands in for the name until then.
     """
-    print(f"You selected {choice}")
-    ticker = yf.Ticker(choice)
-    company_name = ticker.info['longName']
-    print(f"The company name is: {company_name}")
+    cache_path = _cache_path(choice, start_date, end_date)
+    if cache_path.exists():
+        company_name = json.loads(cache_path.with_suffix('.json').read_text())['company_name']
+        return pd.read_parquet(cache_path), company_name
+
+    executor = ThreadPoolExecutor(max_workers=2)
+    try:
+        name_future = executor.submit(_company_name, choice)
+        history_future = executor.submit(yf.Ticker(choice).history, start=start_date, end=end_date)
+        stock_data = history_future.result()
+        company_name = name_future.result() if wait([name_future], timeout=NAME_TIMEOUT).done else None
+    finally:
+        # a slow company name lookup is left to finish in the background instead of holding up the dashboard
+        executor.shutdown(wait=False)
+    if company_name is None:
+        return stock_data, choice
+    _write_cache(choice, start_date, end_date, stock_data, company_name)
+
+    return stock_data, company_name
+
+def _fetch_batch(choices, start_date, end_date):
+    """
+    Function inputs: list of ticker choices, start and end dates of stock history.
+    Downloads the stock data for every ticker with one yf.download call, which still requests each ticker's
+    history separately but spreads the requests over its own threads, while the company names are looked up in parallel.
+    Returns a dictionary mapping each ticker choice to its stock data and company name.
+    Tickers that failed to download are left out, so the caller can fall back to fetching them one at a time.
+    """
+    executor = ThreadPoolExecutor(max_workers=min(len(choices), 10))
+    try:
+        name_futures = [executor.submit(_company_name, choice) for choice in choices]
+        data = yf.download(choices, start=start_date, end=end_date, group_by='ticker',
+                           auto_adjust=True, threads=True, progress=False)
+        wait(name_futures, timeout=NAME_TIMEOUT)
+        names = [future.result() if future.done() else None for future in name_futures]
+    finally:
+        executor.shutdown(wait=False)
+
+    results = {}
+    for choice, company_name in zip(choices, names):
+        # tickers listed on different exchanges leave empty rows on each other's trading days
+        stock_data = data[choice].dropna(how='all')
+        if stock_data.empty:
+            continue
+        if company_name is None:
+            company_name = choice
+        else:
+            _write_cache(choice, start_date, end_date, stock_data, company_name)
+        results[choice] = (stock_data, company_name)
+
+    return results
+
+def ticker(choices, start_date, end_date):
+    """
+    Function inputs: list of ticker choices, start and end dates of stock history.
+    Tickers missing from the cache are downloaded together with one yf.download call; cached tickers, a single
+    missing ticker and any ticker the batch failed on are fetched in parallel, since the requests are network bound.
+    Prints the user selected ticker symbols and company names. 
+    Returns a dictionary mapping each upper-cased ticker choice to its stock data and company name.
+    """
+    # yf.download upper-cases and dedupes the symbols it returns, so normalize them the same way up front,
+    # which also keeps 'aapl' and 'AAPL' on the same cache file
+    choices = list(dict.fromkeys(choice.upper() for choice in choices))
+    print(f"You selected {', '.join(choices)}")
+    misses = [choice for choice in choices if not _cache_path(choice, start_date, end_date).exists()]
+    results = _fetch_batch(misses, start_date, end_date) if len(misses) > 1 else {}
+    pending = [choice for choice in choices if choice not in results]
+    if pending:
+        with ThreadPoolExecutor(max_workers=min(len(pending), 10)) as executor:
+            futures = {executor.submit(_fetch, choice, start_date, end_date): choice for choice in pending}
+            for future in as_completed(futures):
+                results[futures[future]] = future.result()
+
+    for choice in choices:
+        print(f"The company name for {choice} is: {results[choice][1]}")
     print(f'You selected {start_date} to {end_date} as the period')
     print('The dashboard will now open on your browser as an HTML file')
-    stock_data = ticker.history(start=start_date, end=end_date)
 
-    return stock_data, company_name
+    return results
 
 def dataframe(stock_data):
     """
     Function input: stock data from ticker function.
-    Creates a dataframe. Removes the time from the date index column.
-    Resets the index and uses the date as the index column.
-    Sorts the index date column and returns the dataframe.
+    Creates a dataframe with the date index moved into a Date column, with the timezone and time removed.
+    Sorts by date only if the data is not already in chronological order and returns the dataframe.
     """
-    df = pd.DataFrame(stock_data, columns=['Open','High','Low','Close','Volume'])
-    df.index = df.index.date
-    df = df.reset_index()
-    df = df.rename(columns={'index':'Date'})
-    df['Date'] = pd.to_datetime(df['Date'])
-    df = df.sort_values(by=['Date'])
+    df = stock_data[['Open','High','Low','Close','Volume']].reset_index(drop=True)
+    df.insert(0, 'Date', stock_data.index.tz_localize(None).normalize())
+    if not df['Date'].is_monotonic_increasing:
+        df = df.sort_values('Date', ignore_index=True)
 
     return df
 
-def create_scatter_plot(df,company_name):
+def downsample(df, n_out=MAX_POINTS):
     """
-    Function input: dataframe and company name from dataframe function.
+    Function inputs: dataframe from dataframe function and the maximum number of points to plot.
+    Aggregates long histories into n_out buckets of consecutive trading days, keeping the first open, highest high,
+    lowest low, last close and average daily volume of each bucket, dated on the bucket's last trading day.
+    Bucket sizes differ by one day, so volume is averaged rather than summed to keep the bars comparable.
+    Returns the dataframe unchanged if it is already small enough to plot.
+    """
+    if len(df) <= n_out:
+        return df
+
+    starts = np.linspace(0, len(df), n_out, endpoint=False).astype(np.int64)
+    ends = np.append(starts[1:], len(df)) - 1
+    return pd.DataFrame({
+        'Date': df['Date'].values[ends],
+        'Open': df['Open'].values[starts],
+        'High': np.maximum.reduceat(df['High'].values, starts),
+        'Low': np.minimum.reduceat(df['Low'].values, starts),
+        'Close': df['Close'].values[ends],
+        'Volume': np.add.reduceat(df['Volume'].values, starts) / (ends - starts + 1),
+    })
+
+def _weekday_codes(df):
+    """
+    Function input: dataframe from dataframe function.
+    Returns the day of the week of every date as int8 codes (0 = Monday).
+    """
+    # the heatmap axis turns the weekday codes into day names, so only one byte per date is sent to the browser
+    return df['Date'].dt.weekday.to_numpy(np.int8)
+
+def create_source(df, weekdays=True):
+    """
+    Function inputs: dataframe from dataframe or downsample function, and whether the heatmap will use this source.
+    Creates a single data source shared by the charts, so each column is only serialized once into the dashboard.
+    Adds the day of the week (0 = Monday) for the heatmap unless weekdays is False.
+    """
+    data = {column: df[column].to_numpy(np.float64) for column in ['Open', 'High', 'Low', 'Close']}
+    data['Date'] = df['Date'].to_numpy('datetime64[ns]')
+    data['Volume'] = df['Volume'].to_numpy()
+    if weekdays:
+        data['Day'] = _weekday_codes(df)
+
+    return ColumnDataSource(data=data)
+
+def create_heatmap_source(df):
+    """
+    Function input: dataframe from dataframe function.
+    Creates a separate data source for the heatmap from the full history, used when the other charts are downsampled.
+    Downsampled buckets are dated on their last trading day, which only lands on some of the weekdays.
+    """
+    return ColumnDataSource(data={'Date': df['Date'].to_numpy('datetime64[ns]'),
+                                  'Close': df['Close'].to_numpy(np.float64),
+                                  'Day': _weekday_codes(df)})
+
+def create_scatter_plot(source,company_name):
+    """
+    Function input: data source from create_source function and company name from ticker function.
     Creates the scatter plot and formats the chart with the date as x-axis and the open price as the y-axis with a navy blue color.
     The chart outputs the date in mmm yyyy format and finally returns the chart.
     """
     title = f'Open Prices Over Time for {company_name}'
     p = figure(title=title, x_axis_label='', y_axis_label='Open Price')
-    p.scatter(df['Date'], df['Open'], color='navy')
-    p.xaxis[0].formatter = DatetimeTickFormatter(months='%b %Y')
+    p.scatter(x='Date', y='Open', source=source, color='navy')
+    p.xaxis[0].formatter = _MONTH_FMT
     return p
 
-def create_candlestick_chart(df,company_name):
+def create_candlestick_chart(source,company_name):
     """
-    Function input: dataframe and company name from dataframe function.
+    Function input: data source from create_source function and company name from ticker function.
     Creates the candlestick chart and formats the chart with the date as the x-axis and the open/close prices as the y-axis.
     The closing price is the top of each "candlestick", while the open price is the bottom of each "candlestick".
     The chart outputs the date in mmm yyyy format and finally returns the chart.
     """
     title = f'Candlestick Chart for {company_name}'
-    inc = df.Close > df.Open
-    dec = df.Open > df.Close
+    np_close = source.data['Close']
+    np_open = source.data['Open']
+    inc = np_close > np_open
+    dec = ~inc & (np_open != np_close)
+    view_inc = CDSView(filter=BooleanFilter(inc))
+    view_dec = CDSView(filter=BooleanFilter(dec))
     w = 12*60*60*1000 # half day in ms
     p = figure(x_axis_type="datetime", title = title,x_axis_label='')
     p.xaxis.major_label_orientation = np.pi/4
     p.grid.grid_line_alpha=0.3
-    p.segment(df.Date, df.High, df.Date, df.Low, color="black")
-    p.vbar(df.Date[inc], w, df.Open[inc], df.Close[inc], fill_color="#D5E1DD", line_color="black")
-    p.vbar(df.Date[dec], w, df.Open[dec], df.Close[dec], fill_color="#F2583E", line_color="black")
-    p.xaxis[0].formatter = DatetimeTickFormatter(months='%b %Y')
+    p.segment(x0='Date', y0='High', x1='Date', y1='Low', source=source, color="black")
+    p.vbar(x='Date', width=w, top='Open', bottom='Close', source=source, view=view_inc, fill_color="#D5E1DD", line_color="black")
+    p.vbar(x='Date', width=w, top='Open', bottom='Close', source=source, view=view_dec, fill_color="#F2583E", line_color="black")
+    p.xaxis[0].formatter = _MONTH_FMT
     return p
 
-def create_bar_chart(df,company_name):
+def create_bar_chart(source,company_name):
     """
-    Function input: dataframe and company name from dataframe function.
-    Creates a bar chart for the volume of trading activity. X-axis = dates and the y-axis = volume.
+    Function input: data source from create_source function and company name from ticker function.
+    Creates a bar chart for the volume of trading activity. X-axis = dates and the y-axis = volume
+    (average daily volume per bar when the history was downsampled).
     Adds a legend and formats the volume to units of millions in shares. 
     """
     title = f'Volume of Trading Activity for {company_name}'
     p = figure(title=title, x_axis_label='', y_axis_label='Volume')
-    p.vbar(x=df['Date'], top=df['Volume'], width=0.5, color='green', 
+    p.vbar(x='Date', top='Volume', source=source, width=0.5, color='green', 
        fill_alpha=0.5, legend_label='Volume')
     p.legend.title = 'Volume'
     p.legend.location = "top_right"
     p.legend.label_text_font_size = "10pt"
     p.xaxis.major_label_orientation = 1.2
-    p.xaxis[0].formatter = DatetimeTickFormatter(months='%b %Y')
-    p.yaxis.formatter = NumeralTickFormatter(format='0.00a')
+    p.xaxis[0].formatter = _MONTH_FMT
+    p.yaxis.formatter = _VOL_FMT
     return p
 
-def create_heatmap(df, company_name):
+def create_heatmap(source, company_name):
     """
-    Function input: dataframe and company name from dataframe function.
-    Creates a new dataframe for the heatmap. Returns the corresponding day of the dates and the close price between the start and end date.
+    Function input: data source from create_source or create_heatmap_source function and company name from ticker function.
+    Plots the close price between the start and end date against the corresponding day of the dates.
+    The days are stored as weekday codes and labeled with their names on the y-axis.
     Creates a color mapper based on close price and heatmap figure with rectangular glyphs and color bar (on the right)
     """
-    heatmap_df = pd.DataFrame(columns=['Date', 'Day', 'Close'])
-
-    for index, row in df.iterrows():
-        date = row['Date']
-        weekday = date.strftime('%A')
-        close_price = row['Close']
-        heatmap_df = pd.concat([heatmap_df, pd.DataFrame({'Date': [date], 'Day': [weekday], 'Close': [close_price]})])
-
-    color_mapper = LinearColorMapper(palette='RdYlGn11', low=heatmap_df['Close'].min(), high=heatmap_df['Close'].max())
+    color_mapper = LinearColorMapper(palette='RdYlGn11', low=source.data['Close'].min(), high=source.data['Close'].max())
     title = f'Stock History Heatmap for {company_name}'
     heatmap = figure(title=title, x_axis_label='', y_axis_label='Day of Week',
-                     x_axis_type='datetime', y_range=['Monday', 'Tuesday', 'Wednesday', 'Thursday', 'Friday'])
-    heatmap.xaxis[0].formatter = DatetimeTickFormatter(months='%b %Y')
+                     x_axis_type='datetime', y_range=Range1d(-0.5, 4.5))
+    heatmap.xaxis[0].formatter = _MONTH_FMT
+    heatmap.yaxis.ticker = FixedTicker(ticks=[0, 1, 2, 3, 4])
+    heatmap.yaxis.formatter = CustomJSTickFormatter(args=dict(days=WEEKDAYS), code="return days[tick]")
     
-    heatmap.rect(x='Date', y='Day', width=86400000, height=1, source=heatmap_df,
+    heatmap.rect(x='Date', y='Day', width=86400000, height=1, source=source,
                  fill_color={'field': 'Close', 'transform': color_mapper}, line_color=None)
 
     color_bar = ColorBar(color_mapper=color_mapper, label_standoff=12, location=(0, 0))
     heatmap.add_layout(color_bar, 'right')
     return heatmap
 
+@njit(cache=True)
+def _reduce(close_vals, date_vals, pdates_i64, shares_arr):
+    """
+    Function inputs: close prices and trading dates (as int64 nanoseconds) from the dataframe, purchase dates and shares.
+    Returns the total cost and total shares of the purchases, pricing each purchase at the first close on or after its date.
+    """
+    total_cost = 0.0
+    total_shares = 0.0
+    for k in range(pdates_i64.size):
+        i = np.searchsorted(date_vals, pdates_i64[k])
+        total_cost += close_vals[i] * shares_arr[k]
+        total_shares += shares_arr[k]
+    return total_cost, total_shares
+
 def share_price_at_dates(df, shares_input, purchase_date, purchase_info):
     """
     Function input: dataframe from dataframe function, number of share(s) owned and purchase date(s) from get_purchase_info function
@@ -159,13 +356,15 @@ def share_price_at_dates(df, shares_input, purchase_date, purchase_info):
     if not purchase_info:
         print('No purchase information provided')
     else:
-        for purchase_date, shares_owned in purchase_info.items():
-            purchase_df = df[df['Date'] >= pd.to_datetime(purchase_date)]
-            purchase_price = purchase_df.iloc[0]['Close']
-            purchase_cost = purchase_price * shares_owned
-            total_cost += purchase_cost
-            total_shares += shares_owned
-
+        # look up the first close on or after every purchase date in one pass over the sorted dates
+        date_vals = df['Date'].to_numpy('datetime64[ns]').view(np.int64)
+        close_vals = df['Close'].to_numpy(np.float64)
+        pdates_i64 = pd.to_datetime(list(purchase_info.keys())).to_numpy('datetime64[ns]').view(np.int64)
+        shares_arr = np.fromiter(purchase_info.values(), dtype=np.float64, count=len(purchase_info))
+        # the compiled loop does not bounds check, so reject purchases after the last trading day here
+        if pdates_i64.max() > date_vals[-1]:
+            raise IndexError('Purchase date is after the last trading day of the selected period')
+        total_cost, total_shares = _reduce(close_vals, date_vals, pdates_i64, shares_arr)
         total_shares += shares_input
 
         if total_shares == 0:
@@ -182,30 +381,20 @@ def share_price_at_dates(df, shares_input, purchase_date, purchase_info):
 def purchase_details(purchase_date, end_date, total_cost, total_shares, average_cost_basis, current_value, gain_or_loss):
     """
     Function input: dataframe from dataframe function, number of share(s) owned and purchase date(s) from get_purchase_info function
-    Calculates the accumulation of shares, total share cost, average cost basis, current share price, current total stock value, and gain or loss value.
+    Formats the total share cost, total shares, current total stock value, average cost basis, and gain or loss value as HTML lines.
     """
-    output = []
-    output.append(f"Total Cost: ${total_cost:,.2f}")
-    output.append(f"Total Shares: {total_shares:,.2f}")
-    output.append(f"Current Value: ${current_value:,.2f}")
-    output.append(f'Average Cost Basis: ${average_cost_basis:,.2f}')
-    if gain_or_loss > 0:
-        output.append(f"Gain between {purchase_date} and {end_date}: ${gain_or_loss:,.0f}")
-    else:
-        output.append(f"Loss between {purchase_date} and {end_date}: ${gain_or_loss:,.0f}")
-    return output
+    return PURCHASE_DETAILS_TEMPLATE.format(tc=total_cost, ts=total_shares, cv=current_value, ab=average_cost_basis,
+                                            label=GL_STYLE[gain_or_loss > 0][0], pd=purchase_date, ed=end_date,
+                                            gl=gain_or_loss)
 
 def create_dashboard_text(purchase_date, end_date, total_cost, total_shares, average_cost_basis, current_value, gain_or_loss):
     """
     Function input: end date of stock history from user input function, number of share(s) owned and purchase date(s) from get_purchase_info function, share costs and values, and gain or loss from get_purchase_details function
     Calculates the accumulation of shares, total share cost, average cost basis, current share price, current total stock value, and gain or loss value.
     """
-    output = purchase_details(purchase_date, end_date, total_cost, total_shares, average_cost_basis, current_value, gain_or_loss)
-    text = "<br>".join(output)
-    if gain_or_loss > 0:
-        text += "<br><span style='color:green;font-weight:bold'>Gain</span>"
-    else:
-        text += "<br><span style='color:red;font-weight:bold'>Loss</span>"
+    text = purchase_details(purchase_date, end_date, total_cost, total_shares, average_cost_basis, current_value, gain_or_loss)
+    label, color = GL_STYLE[gain_or_loss > 0]
+    text += f"<br><span style='color:{color};font-weight:bold'>{label}</span>"
     div = Div(text=text, width=400,styles={'font-size': '20pt'})
     return div
 
@@ -257,16 +446,23 @@ def show_dashboard(p1, p2, p3, p4, div, company_name, choice, start_date, end_da
     show(col)
 
 def main():
+    parser = argparse.ArgumentParser(description='Stock History Data Analysis Dashboard')
+    parser.add_argument('--purchases', help='CSV file of purchase dates and shares, instead of entering them interactively')
+    args = parser.parse_args()
+
     choice, start_date, end_date, shares_input,purchase_date = user_input()
-    stock_data, company_name = ticker(choice, start_date, end_date)
+    stock_data, company_name = ticker([choice], start_date, end_date)[choice.upper()]
     df = dataframe(stock_data)
-    p1 = create_scatter_plot(df,company_name)
-    p2 = create_candlestick_chart(df,company_name)
-    p3 = create_bar_chart(df,company_name)
-    p4 = create_heatmap(df,company_name)
-    purchase_info = get_purchase_info()
+    chart_df = downsample(df)
+    source = create_source(chart_df, weekdays=chart_df is df)
+    # the heatmap plots every trading day on its own weekday, so it only shares the source when nothing was aggregated
+    heatmap_source = source if chart_df is df else create_heatmap_source(df)
+    p1 = create_scatter_plot(source,company_name)
+    p2 = create_candlestick_chart(source,company_name)
+    p3 = create_bar_chart(source,company_name)
+    p4 = create_heatmap(heatmap_source,company_name)
+    purchase_info = read_purchase_info(args.purchases) if args.purchases else get_purchase_info()
     total_cost, total_shares, average_cost_basis, current_value, gain_or_loss = share_price_at_dates(df, shares_input, purchase_date, purchase_info)
-    purchase_details(purchase_date, end_date, total_cost, total_shares, average_cost_basis, current_value, gain_or_loss)
     div = create_dashboard_text(purchase_date, end_date, total_cost, total_shares, average_cost_basis, current_value, gain_or_loss)
     show_dashboard(p1, p2, p3, p4, div, company_name, choice, start_date, end_date)
 